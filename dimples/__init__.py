@@ -28,16 +28,13 @@
 # SOFTWARE.
 # ==============================================================================
 
+import importlib
+
 from dimsdk import *
 from dimsdk.cpu import *
 from dimplugins import *
 
 from .common import *
-from .conn import *
-from .database import *
-from .group import *
-
-from .emitter import Emitter
 
 
 name = 'DIMPLES'
@@ -45,6 +42,34 @@ name = 'DIMPLES'
 __author__ = 'Albert Moky'
 
 
+#
+#   Lazy loading (PEP 562)
+#   ~~~~~~~~~~~~~~~~~~~~~~
+#
+#   sub-packages below are only loaded when their names are accessed
+#   from this package, so importing 'dimples.client' (or any other
+#   sub-package) will not load the connection & database modules too.
+#
+_LAZY_MODULES = [
+    '.group',
+    '.conn',
+    '.database',
+    '.emitter',
+]
+
+
+def __getattr__(attr: str):
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(module_name, __name__)
+        exports = getattr(module, '__all__', None)
+        if exports is None or attr in exports:
+            value = getattr(module, attr, None)
+            if value is not None:
+                globals()[attr] = value
+                return value
+    raise AttributeError('module %r has no attribute %r' % (__name__, attr))
+
+
 __all__ = [
 
     'Emitter',
@@ -248,11 +273,6 @@ __all__ = [
     #
     ####################################
 
-    'ContentProcessor',
-    'ContentProcessorCreator',
-    'ContentProcessorFactory',
-    'GeneralContentProcessorFactory',
-
     'BaseContentProcessor',
     'BaseCommandProcessor',
 
@@ -432,17 +452,6 @@ __all__ = [
     #
     ####################################
 
-    'PrivateKeyDBI', 'MetaDBI', 'DocumentDBI',
-    'UserDBI', 'ContactDBI', 'GroupDBI', 'GroupHistoryDBI',
-    'AccountDBI',
-
-    'ReliableMessageDBI', 'CipherKeyDBI', 'GroupKeysDBI',
-    'MessageDBI',
-
-    'ProviderDBI', 'StationDBI', 'LoginDBI',
-    'SessionDBI',
-    'ProviderInfo', 'StationInfo',
-
     #
     #   DOS
     #
@@ -28,26 +28,59 @@
 # SOFTWARE.
 # ==============================================================================
 
+import asyncio
+import time
 import weakref
-from typing import Optional, List
+from typing import Optional, Tuple, List, Set
 
 from dimsdk import ID, Document, Visa
 from dimsdk import MetaCommand, DocumentCommand
 from dimsdk import GroupCommand, QueryCommand
 from dimsdk import Station
 
+from ..utils import Runner
 from ..utils import Logging
 from ..common import EntityChecker
 from ..common import AccountDBI
 from ..common import CommonFacebook, CommonMessenger
 
+from .network import ClientSession
+
+
+# any station, the default receiver for meta/document queries
+ANY_STATION = Station.ANY
+
+
+class BriefIDs:
+    """ Lazy description for ID list in log messages """
+
+    MAX_ITEMS = 8
+
+    def __init__(self, array: List[ID]):
+        super().__init__()
+        self.__array = array
+
+    def __str__(self) -> str:
+        array = self.__array
+        count = len(array)
+        if count > self.MAX_ITEMS:
+            return '[%s, ... (%d IDs)]' % (', '.join([str(item) for item in array[:self.MAX_ITEMS]]), count)
+        return str(array)
+
 
 class ClientChecker(EntityChecker, Logging):
 
+    # session state will be checked again after 50 milliseconds
+    SESSION_READY_EXPIRES = 0.05
+
     def __init__(self, database: AccountDBI, facebook: CommonFacebook):
         super().__init__(database=database)
         self.__barrack = weakref.ref(facebook)
         self.__transceiver = None
+        # (last checked time, ready flag)
+        self.__session_ready: Tuple[float, bool] = (0.0, False)
+        # background tasks, keep references until done
+        self.__tasks: Set[asyncio.Task] = set()
 
     @property
     def facebook(self) -> Optional[CommonFacebook]:
@@ -62,6 +95,28 @@ class ClientChecker(EntityChecker, Logging):
     @messenger.setter
     def messenger(self, transceiver: CommonMessenger):
         self.__transceiver = None if transceiver is None else weakref.ref(transceiver)
+        self.__session_ready = (0.0, False)
+
+    # protected
+    def _run_background(self, coro):
+        """ run coroutine in background without waiting for it """
+        task = Runner.async_task(coro=coro)
+        tasks = self.__tasks
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    # protected
+    def _check_session_ready(self) -> bool:
+        """ check whether current session is ready for sending queries """
+        now = time.monotonic()
+        last_time, ready = self.__session_ready
+        if now - last_time < self.SESSION_READY_EXPIRES:
+            return ready
+        messenger = self.messenger
+        session = None if messenger is None else messenger.session
+        ready = isinstance(session, ClientSession) and session.ready is True
+        self.__session_ready = (now, ready)
+        return ready
 
     # Override
     async def query_meta(self, identifier: ID) -> bool:
@@ -69,13 +124,16 @@ class ClientChecker(EntityChecker, Logging):
         if messenger is None:
             self.error(msg='messenger not ready yet')
             return False
+        elif not self._check_session_ready():
+            self.warning('session not ready yet, cannot query meta: %s', identifier)
+            return False
         elif not self.is_meta_query_expired(identifier=identifier):
             # query not expired yet
-            self.info(msg='meta query not expired yet: %s' % identifier)
+            self.info('meta query not expired yet: %s', identifier)
             return False
-        self.info(msg='querying meta for: %s' % identifier)
+        self.info('querying meta for: %s', identifier)
         content = MetaCommand.query(identifier=identifier)
-        _, r_msg = await messenger.send_content(content=content, sender=None, receiver=Station.ANY, priority=1)
+        _, r_msg = await messenger.send_content(content=content, sender=None, receiver=ANY_STATION, priority=1)
         return r_msg is not None
 
     # Override
@@ -84,14 +142,17 @@ class ClientChecker(EntityChecker, Logging):
         if messenger is None:
             self.error(msg='messenger not ready yet')
             return False
+        elif not self._check_session_ready():
+            self.warning('session not ready yet, cannot query documents: %s', identifier)
+            return False
         elif not self.is_document_query_expired(identifier=identifier):
             # query not expired yet
-            self.info(msg='document query not expired yet: %s' % identifier)
+            self.info('document query not expired yet: %s', identifier)
             return False
         last_time = self.get_last_document_time(identifier=identifier, documents=documents)
-        self.info(msg='querying document for: %s, last time: %s' % (identifier, last_time))
+        self.info('querying document for: %s, last time: %s', identifier, last_time)
         content = DocumentCommand.query(identifier=identifier, last_time=last_time)
-        _, r_msg = await messenger.send_content(content=content, sender=None, receiver=Station.ANY, priority=1)
+        _, r_msg = await messenger.send_content(content=content, sender=None, receiver=ANY_STATION, priority=1)
         return r_msg is not None
 
     # Override
@@ -101,9 +162,12 @@ class ClientChecker(EntityChecker, Logging):
         if facebook is None or messenger is None:
             self.error(msg='facebook messenger not ready yet')
             return False
+        elif not self._check_session_ready():
+            self.warning('session not ready yet, cannot query members: %s', group)
+            return False
         elif not self.is_members_query_expired(identifier=group):
             # query not expired yet
-            self.info('members query not expired yet: %s' % group)
+            self.info('members query not expired yet: %s', group)
             return False
         user = await facebook.current_user
         if user is None:
@@ -111,19 +175,22 @@ class ClientChecker(EntityChecker, Logging):
             return False
         me = user.identifier
         last_time = await self.get_last_group_history_time(group=group)
-        self.info(msg='querying members for group: %s, last time: %s' % (group, last_time))
+        self.info('querying members for group: %s, last time: %s', group, last_time)
         # build query command for group members
         command = GroupCommand.query(group=group, last_time=last_time)
         # 1. check group bots
-        ok = await self.query_members_from_assistants(command=command, sender=me, group=group)
+        ok = await self.query_members_from_assistants(command=command, sender=me, group=group,
+                                                      facebook=facebook, messenger=messenger)
         if ok:
             return True
         # 2. check administrators
-        ok = await self.query_members_from_administrators(command=command, sender=me, group=group)
+        ok = await self.query_members_from_administrators(command=command, sender=me, group=group,
+                                                          facebook=facebook, messenger=messenger)
         if ok:
             return True
         # 3. check group owner
-        ok = await self.query_members_from_owner(command=command, sender=me, group=group)
+        ok = await self.query_members_from_owner(command=command, sender=me, group=group,
+                                                 facebook=facebook, messenger=messenger)
         if ok:
             return True
         # all failed, try last active member
@@ -131,32 +198,36 @@ class ClientChecker(EntityChecker, Logging):
         if last_member is None:
             r_msg = None
         else:
-            self.info(msg='querying members from: %s, group: %s' % (last_member, group))
+            self.info('querying members from: %s, group: %s', last_member, group)
             _, r_msg = await messenger.send_content(sender=me, receiver=last_member, content=command, priority=1)
-        self.error(msg='group not ready: %s' % group)
+        self.error('group not ready: %s', group)
         return r_msg is not None
 
     # protected
-    async def query_members_from_assistants(self, command: QueryCommand, sender: ID, group: ID) -> bool:
-        facebook = self.facebook
-        messenger = self.messenger
+    async def query_members_from_assistants(self, command: QueryCommand, sender: ID, group: ID,
+                                            facebook: CommonFacebook = None,
+                                            messenger: CommonMessenger = None) -> bool:
+        if facebook is None:
+            facebook = self.facebook
+        if messenger is None:
+            messenger = self.messenger
         if facebook is None or messenger is None:
             self.error(msg='facebook messenger not ready yet')
             return False
         bots = await facebook.get_assistants(group)
         if bots is None or len(bots) == 0:
-            self.warning(msg='assistants not designated for group: %s' % group)
+            self.warning('assistants not designated for group: %s', group)
             return False
-        success = 0
         # querying members from bots
-        self.info(msg='querying members from bots: %s, group: %s' % (bots, group))
-        for receiver in bots:
-            if receiver == sender:
-                self.warning(msg='ignore cycled querying: %s, group: %s' % (receiver, group))
-                continue
-            _, r_msg = await messenger.send_content(sender=sender, receiver=receiver, content=command, priority=1)
-            if r_msg is not None:
-                success += 1
+        self.info('querying members from bots: %s, group: %s', BriefIDs(bots), group)
+        receivers = [item for item in bots if item != sender]
+        if len(receivers) < len(bots):
+            self.warning('ignore cycled querying: %s, group: %s', sender, group)
+        if len(receivers) == 0:
+            # failed
+            return False
+        results = await messenger.send_content_many(sender=sender, receivers=receivers, content=command, priority=1)
+        success = len([r_msg for r_msg in results if r_msg is not None])
         if success == 0:
             # failed
             return False
@@ -165,31 +236,36 @@ class ClientChecker(EntityChecker, Logging):
             # last active member is a bot??
             pass
         else:
-            self.info(msg='querying members from: %s, group: %s' % (last_member, group))
-            await messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self.info('querying members from: %s, group: %s', last_member, group)
+            coro = messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self._run_background(coro=coro)
         return True
 
     # protected
-    async def query_members_from_administrators(self, command: QueryCommand, sender: ID, group: ID) -> bool:
-        facebook = self.facebook
-        messenger = self.messenger
+    async def query_members_from_administrators(self, command: QueryCommand, sender: ID, group: ID,
+                                                facebook: CommonFacebook = None,
+                                                messenger: CommonMessenger = None) -> bool:
+        if facebook is None:
+            facebook = self.facebook
+        if messenger is None:
+            messenger = self.messenger
         if facebook is None or messenger is None:
             self.error(msg='facebook messenger not ready yet')
             return False
         admins = await facebook.get_administrators(group)
         if len(admins) == 0:
-            self.warning(msg='administrators not found for group: %s' % group)
+            self.warning('administrators not found for group: %s', group)
             return False
-        success = 0
         # querying members from admins
-        self.info(msg='querying members from admins: %s, group: %s' % (admins, group))
-        for receiver in admins:
-            if receiver == sender:
-                self.warning(msg='ignore cycled querying: %s, group: %s' % (receiver, group))
-                continue
-            _, r_msg = await messenger.send_content(sender=sender, receiver=receiver, content=command, priority=1)
-            if r_msg is not None:
-                success += 1
+        self.info('querying members from admins: %s, group: %s', BriefIDs(admins), group)
+        receivers = [item for item in admins if item != sender]
+        if len(receivers) < len(admins):
+            self.warning('ignore cycled querying: %s, group: %s', sender, group)
+        if len(receivers) == 0:
+            # failed
+            return False
+        results = await messenger.send_content_many(sender=sender, receivers=receivers, content=command, priority=1)
+        success = len([r_msg for r_msg in results if r_msg is not None])
         if success == 0:
             # failed
             return False
@@ -198,26 +274,31 @@ class ClientChecker(EntityChecker, Logging):
             # last active member is an admin, already queried
             pass
         else:
-            self.info(msg='querying members from: %s, group: %s' % (last_member, group))
-            await messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self.info('querying members from: %s, group: %s', last_member, group)
+            coro = messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self._run_background(coro=coro)
         return True
 
     # protected
-    async def query_members_from_owner(self, command: QueryCommand, sender: ID, group: ID) -> bool:
-        facebook = self.facebook
-        messenger = self.messenger
+    async def query_members_from_owner(self, command: QueryCommand, sender: ID, group: ID,
+                                       facebook: CommonFacebook = None,
+                                       messenger: CommonMessenger = None) -> bool:
+        if facebook is None:
+            facebook = self.facebook
+        if messenger is None:
+            messenger = self.messenger
         if facebook is None or messenger is None:
             self.error(msg='facebook messenger not ready yet')
             return False
         owner = await facebook.get_owner(group)
         if owner is None:
-            self.warning(msg='owner not found for group: %s' % group)
+            self.warning('owner not found for group: %s', group)
             return False
         elif owner == sender:
-            self.error(msg='you are the owner of group: %s' % group)
+            self.error('you are the owner of group: %s', group)
             return False
         # querying members from owner
-        self.info(msg='querying members from owner: %s, group: %s' % (owner, group))
+        self.info('querying members from owner: %s, group: %s', owner, group)
         _, r_msg = await messenger.send_content(sender=sender, receiver=owner, content=command, priority=1)
         if r_msg is None:
             # failed
@@ -227,15 +308,16 @@ class ClientChecker(EntityChecker, Logging):
             # last active member is the owner, already queried
             pass
         else:
-            self.info(msg='querying members from: %s, group: %s' % (last_member, group))
-            await messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self.info('querying members from: %s, group: %s', last_member, group)
+            coro = messenger.send_content(sender=sender, receiver=last_member, content=command, priority=1)
+            self._run_background(coro=coro)
         return True
 
     # Override
     async def send_visa(self, visa: Visa, receiver: ID, updated: bool = False) -> bool:
         me = visa.identifier
         if me == receiver:
-            self.warning(msg='skip cycled message: %s, %s' % (receiver, visa))
+            self.warning('skip cycled message: %s, %s', receiver, visa)
             return False
         messenger = self.messenger
         if messenger is None:
@@ -243,9 +325,31 @@ class ClientChecker(EntityChecker, Logging):
             return False
         elif not self.is_document_response_expired(identifier=receiver, force=updated):
             # response not expired yet
-            self.debug(msg='visa response not expired yet: %s' % receiver)
+            self.debug('visa response not expired yet: %s', receiver)
             return False
-        self.info(msg='push visa document: %s => %s' % (me, receiver))
+        self.info('push visa document: %s => %s', me, receiver)
         content = DocumentCommand.response(document=visa, identifier=me)
         _, r_msg = await messenger.send_content(content=content, sender=me, receiver=receiver, priority=1)
         return r_msg is not None
+
+    # Override
+    async def send_visa_many(self, visa: Visa, receivers: List[ID], updated: bool = False) -> int:
+        """
+        Send my visa document to contacts with one document command
+
+        :return: count of visa sent
+        """
+        me = visa.identifier
+        messenger = self.messenger
+        if messenger is None:
+            self.error(msg='messenger not ready yet')
+            return 0
+        receivers = [item for item in receivers
+                     if item != me and self.is_document_response_expired(identifier=item, force=updated)]
+        if len(receivers) == 0:
+            # responses not expired yet
+            return 0
+        self.info('push visa document: %s => %s', me, BriefIDs(receivers))
+        content = DocumentCommand.response(document=visa, identifier=me)
+        results = await messenger.send_content_many(content=content, sender=me, receivers=receivers, priority=1)
+        return len(results) - results.count(None)
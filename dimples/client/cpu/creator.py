@@ -67,35 +67,30 @@ class ClientContentProcessorCreator(BaseContentProcessorCreator):
 
     # Override
     def create_command_processor(self, msg_type: Union[int, ContentType], cmd: str) -> Optional[ContentProcessor]:
-        # receipt
-        if cmd == Command.RECEIPT:
-            return ReceiptCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        # handshake
-        if cmd == HandshakeCommand.HANDSHAKE:
-            return HandshakeCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        # login
-        if cmd == LoginCommand.LOGIN:
-            return LoginCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        # ans
-        if cmd == AnsCommand.ANS:
-            return AnsCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        # group commands
-        if cmd == 'group':
-            return GroupCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.INVITE:
-            return InviteCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.EXPEL:
-            # Deprecated (use 'reset' instead)
-            return ExpelCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.JOIN:
-            return JoinCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.QUIT:
-            return QuitCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.QUERY:
-            return QueryCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.RESET:
-            return ResetCommandProcessor(facebook=self.facebook, messenger=self.messenger)
-        elif cmd == GroupCommand.RESIGN:
-            return ResignCommandProcessor(facebook=self.facebook, messenger=self.messenger)
+        clazz = _COMMAND_PROCESSORS.get(cmd)
+        if clazz is not None:
+            return clazz(facebook=self.facebook, messenger=self.messenger)
         # others
         return super().create_command_processor(msg_type=msg_type, cmd=cmd)
+
+
+# command name => processor class
+_COMMAND_PROCESSORS = {
+    # receipt
+    Command.RECEIPT: ReceiptCommandProcessor,
+    # handshake
+    HandshakeCommand.HANDSHAKE: HandshakeCommandProcessor,
+    # login
+    LoginCommand.LOGIN: LoginCommandProcessor,
+    # ans
+    AnsCommand.ANS: AnsCommandProcessor,
+    # group commands
+    'group': GroupCommandProcessor,
+    GroupCommand.INVITE: InviteCommandProcessor,
+    GroupCommand.EXPEL: ExpelCommandProcessor,  # Deprecated (use 'reset' instead)
+    GroupCommand.JOIN: JoinCommandProcessor,
+    GroupCommand.QUIT: QuitCommandProcessor,
+    GroupCommand.QUERY: QueryCommandProcessor,
+    GroupCommand.RESET: ResetCommandProcessor,
+    GroupCommand.RESIGN: ResignCommandProcessor,
+}
@@ -29,11 +29,12 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from dimsdk import ID
 from dimsdk import ReliableMessage
 from dimsdk import Content
+from dimsdk import Facebook, Messenger
 from dimsdk.cpu import BaseContentProcessor
 
 from ...common import CustomizedContent
@@ -64,8 +65,35 @@ class CustomizedContentProcessor(BaseContentProcessor, CustomizedContentHandler)
     """
         Customized Content Processing Unit
         ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+        Handlers are registered with app ID & module name,
+        so they can be found by hash lookup directly.
     """
 
+    # receipt texts for unsupported contents
+    NOT_SUPPORT_TEXT = 'Content not support.'
+    APP_NOT_SUPPORT = 'Customized content (app: ${app}) not support yet!'
+    ACT_NOT_SUPPORT = 'Customized content (app: ${app}, mod: ${mod}, act: ${act}) not support yet!'
+
+    def __init__(self, facebook: Facebook, messenger: Messenger):
+        super().__init__(facebook=facebook, messenger=messenger)
+        # app => mod => handler
+        self.__handlers: Dict[str, Dict[str, CustomizedContentHandler]] = {}
+
+    def set_handler(self, app: str, mod: str, handler: CustomizedContentHandler):
+        """ Register handler for module in application """
+        table = self.__handlers.get(app)
+        if table is None:
+            table = {}
+            self.__handlers[app] = table
+        table[mod] = handler
+
+    def get_handler(self, app: str, mod: str) -> Optional[CustomizedContentHandler]:
+        """ Get handler for module in application """
+        table = self.__handlers.get(app)
+        if table is not None:
+            return table.get(mod)
+
     # Override
     async def process_content(self, content: Content, r_msg: ReliableMessage) -> List[Content]:
         assert isinstance(content, CustomizedContent), 'customized content error: %s' % content
@@ -84,7 +112,7 @@ class CustomizedContentProcessor(BaseContentProcessor, CustomizedContentHandler)
         # 3. do the job
         act = content.action
         sender = r_msg.sender
-        return await handler.handle_action(act, sender=sender, content=content, msg=r_msg)
+        return await handler.handle_action(act, sender, content, r_msg)
 
     # noinspection PyUnusedLocal
     def _filter(self, app: str, content: CustomizedContent, msg: ReliableMessage) -> Optional[List[Content]]:
@@ -97,9 +125,11 @@ class CustomizedContentProcessor(BaseContentProcessor, CustomizedContentHandler)
         :param msg:     received message
         :return: None on app ID matched
         """
-        text = 'Content not support.'
-        return self._respond_receipt(text=text, content=content, envelope=msg.envelope, extra={
-            'template': 'Customized content (app: ${app}) not support yet!',
+        if app in self.__handlers:
+            # app ID registered
+            return None
+        return self._respond_receipt(text=self.NOT_SUPPORT_TEXT, content=content, envelope=msg.envelope, extra={
+            'template': self.APP_NOT_SUPPORT,
             'replacements': {
                 'app': app,
             }
@@ -110,20 +140,18 @@ class CustomizedContentProcessor(BaseContentProcessor, CustomizedContentHandler)
         """ Override for you module """
         # if the application has too many modules, I suggest you to
         # use different handler to do the job for each module.
-        return self
+        handler = self.get_handler(app=content.application, mod=mod)
+        return self if handler is None else handler
 
     # Override
     async def handle_action(self, act: str, sender: ID,
                             content: CustomizedContent, msg: ReliableMessage) -> List[Content]:
         """ Override for customized actions """
-        app = content.application
-        mod = content.module
-        text = 'Content not support.'
-        return self._respond_receipt(text=text, content=content, envelope=msg.envelope, extra={
-            'template': 'Customized content (app: ${app}, mod: ${mod}, act: ${act}) not support yet!',
+        return self._respond_receipt(text=self.NOT_SUPPORT_TEXT, content=content, envelope=msg.envelope, extra={
+            'template': self.ACT_NOT_SUPPORT,
             'replacements': {
-                'app': app,
-                'mod': mod,
+                'app': content.application,
+                'mod': content.module,
                 'act': act,
             }
         })
@@ -201,10 +201,17 @@ class GroupCommandProcessor(HistoryCommandProcessor):
 
     async def _check_group_members(self, content: GroupCommand, r_msg: ReliableMessage
                                    ) -> Tuple[Optional[ID], List[ID], List[Content]]:
+        owner, members, _, errors = await self._check_group_context(content=content, r_msg=r_msg)
+        return owner, members, errors
+
+    async def _check_group_context(self, content: GroupCommand, r_msg: ReliableMessage
+                                   ) -> Tuple[Optional[ID], List[ID], List[ID], List[Content]]:
+        """ get owner, members & administrators of the group """
         group = content.group
         assert group is not None, 'group command error: %s' % content
         owner = await self._owner(group=group)
         members = await self._members(group=group)
+        admins = await self._administrators(group=group)
         if owner is None or len(members) == 0:
             # TODO: query group members?
             text = 'Group empty.'
@@ -217,7 +224,7 @@ class GroupCommandProcessor(HistoryCommandProcessor):
         else:
             # group is ready
             errors = None
-        return owner, members, errors
+        return owner, members, admins, errors
 
     # protected
     async def send_group_histories(self, group: ID, receiver: ID) -> bool:
@@ -64,15 +64,11 @@ class InviteCommandProcessor(GroupCommandProcessor):
             return errors
 
         # 1. check group
-        trip = await self._check_group_members(content=content, r_msg=r_msg)
-        owner = trip[0]
-        members = trip[1]
-        errors = trip[2]
+        owner, members, admins, errors = await self._check_group_context(content=content, r_msg=r_msg)
         if owner is None or len(members) == 0:
             return errors
 
         sender = r_msg.sender
-        admins = await self._administrators(group=group)
         is_owner = sender == owner
         is_admin = sender in admins
         is_member = sender in members
@@ -129,8 +125,10 @@ class InviteCommandProcessor(GroupCommandProcessor):
 def calculate_invited(members: List[ID], invite_list: List[ID]) -> Tuple[List[ID], List[ID]]:
     new_members = members.copy()
     added_list = []
+    exists = set(members)
     for item in invite_list:
-        if item not in new_members:
+        if item not in exists:
+            exists.add(item)
             new_members.append(item)
             added_list.append(item)
     return new_members, added_list
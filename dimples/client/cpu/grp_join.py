@@ -58,12 +58,11 @@ class JoinCommandProcessor(GroupCommandProcessor):
             return errors
 
         # 1. check group
-        owner, members, errors = await self._check_group_members(content=content, r_msg=r_msg)
+        owner, members, admins, errors = await self._check_group_context(content=content, r_msg=r_msg)
         if owner is None or len(members) == 0:
             return errors
 
         sender = r_msg.sender
-        admins = await self._administrators(group=group)
         is_owner = sender == owner
         is_admin = sender in admins
         is_member = sender in members
@@ -63,12 +63,11 @@ class ResetCommandProcessor(GroupCommandProcessor):
             return errors
 
         # 1. check group
-        owner, members, errors = await self._check_group_members(content=content, r_msg=r_msg)
+        owner, members, administrators, errors = await self._check_group_context(content=content, r_msg=r_msg)
         if owner is None or len(members) == 0:
             return errors
 
         sender = r_msg.sender
-        administrators = await self._administrators(group=group)
         is_owner = sender == owner
         is_admin = sender in administrators
 
@@ -130,14 +129,10 @@ class ResetCommandProcessor(GroupCommandProcessor):
 
 
 def calculate_reset(old_members: List[ID], new_members: List[ID]) -> Tuple[List[ID], List[ID]]:
-    add_list = []
-    remove_list = []
+    old_set = set(old_members)
+    new_set = set(new_members)
     # build invited-list
-    for item in new_members:
-        if item not in old_members:
-            add_list.append(item)
+    add_list = [item for item in new_members if item not in old_set]
     # build expelled-list
-    for item in old_members:
-        if item not in new_members:
-            remove_list.append(item)
+    remove_list = [item for item in old_members if item not in new_set]
     return add_list, remove_list
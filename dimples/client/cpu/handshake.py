@@ -40,6 +40,9 @@ from dimsdk.cpu import BaseCommandProcessor
 from ...utils import Logging
 from ...common import HandshakeCommand
 
+from ..network import ClientSession
+from ..messenger import ClientMessenger
+
 
 class HandshakeCommandProcessor(BaseCommandProcessor, Logging):
 
@@ -108,7 +111,6 @@ class HandshakeCommandProcessor(BaseCommandProcessor, Logging):
 
 def get_client_messenger(cpu):
     messenger = cpu.messenger
-    from ..messenger import ClientMessenger
     assert isinstance(messenger, ClientMessenger), 'messenger error: %s' % messenger
     return messenger
 
@@ -117,6 +119,5 @@ def get_client_session(messenger=None, cpu=None):
     if messenger is None:
         messenger = get_client_messenger(cpu=cpu)
     session = messenger.session
-    from ..network.session import ClientSession
     assert isinstance(session, ClientSession), 'session error: %s' % session
     return session
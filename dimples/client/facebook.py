@@ -30,7 +30,9 @@
     Barrack for cache entities
 """
 
-from typing import Optional, List
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, List, Dict
 
 from dimsdk import EntityType
 from dimsdk import ID, Document, Bulletin
@@ -38,15 +40,34 @@ from dimsdk import User, Group
 
 from ..utils import Runner
 from ..common import BroadcastUtils
+from ..common import AccountDBI
 from ..common import CommonFacebook
 from ..group import SharedGroupManager
 
 
 class ClientFacebook(CommonFacebook):
 
+    # a group command asks for the owner, members & administrators in turn,
+    # each of them checks the bulletin document, so keep it for a moment
+    BULLETIN_EXPIRES = 2  # seconds
+    BULLETIN_CAPACITY = 256
+
+    def __init__(self, database: AccountDBI):
+        super().__init__(database=database)
+        self.__group_manager: Optional[SharedGroupManager] = None
+        # group => (bulletin, expired time)
+        self.__bulletins: Dict[ID, Tuple[Optional[Bulletin], float]] = OrderedDict()
+
+    @property
+    def group_manager(self) -> SharedGroupManager:
+        man = self.__group_manager
+        if man is None:
+            self.__group_manager = man = SharedGroupManager()
+        return man
+
     # Override
     def cache_group(self, group: Group):
-        group.data_source = SharedGroupManager()
+        group.data_source = self.group_manager
         super().cache_group(group=group)
 
     # Override
@@ -71,10 +92,25 @@ class ClientFacebook(CommonFacebook):
                 # DISCUSS: set this item to be current user?
                 return item
 
+    # Override
+    async def get_bulletin(self, group: ID) -> Optional[Bulletin]:
+        cache = self.__bulletins
+        pair = cache.get(group)
+        now = time.monotonic()
+        if pair is not None and pair[1] > now:
+            return pair[0]
+        doc = await super().get_bulletin(group=group)
+        cache[group] = (doc, now + self.BULLETIN_EXPIRES)
+        cache.move_to_end(group)
+        if len(cache) > self.BULLETIN_CAPACITY:
+            cache.popitem(last=False)
+        return doc
+
     # Override
     async def save_document(self, document: Document) -> bool:
         ok = await super().save_document(document=document)
         if ok and isinstance(document, Bulletin):
+            self.__bulletins.pop(document.identifier, None)
             # check administrators
             array = document.get_property(name='administrators')
             if array is not None:
@@ -109,7 +145,7 @@ class ClientFacebook(CommonFacebook):
         # get from bulletin document
         user = doc.founder
         if user is None:
-            self.error(msg='founder not designated for group: %s' % identifier)
+            self.error('founder not designated for group: %s', identifier)
         return user
 
     # Override
@@ -137,7 +173,7 @@ class ClientFacebook(CommonFacebook):
             if user is None:
                 user = doc.founder
         if user is None:
-            self.error(msg='owner not found for group: %s' % identifier)
+            self.error('owner not found for group: %s', identifier)
         return user
 
     # Override
@@ -150,7 +186,7 @@ class ClientFacebook(CommonFacebook):
         # check group owner
         owner = await self.get_owner(identifier=identifier)
         if owner is None:
-            self.error(msg='group empty: %s' % identifier)
+            self.error('group empty: %s', identifier)
             return []
         db = self.database
         # check local storage
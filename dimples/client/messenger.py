@@ -41,18 +41,23 @@ from dimsdk import ReceiptCommand
 from dimsdk import MessageUtils
 
 from ..common import HandshakeCommand, ReportCommand, LoginCommand
-from ..common import CommonMessenger
+from ..common import MessageDBI
+from ..common import CommonFacebook, CommonMessenger
 
 from .network import ClientSession
 
 
 class ClientMessenger(CommonMessenger):
 
-    @property
+    def __init__(self, session: ClientSession, facebook: CommonFacebook, database: MessageDBI):
+        super().__init__(session=session, facebook=facebook, database=database)
+        assert isinstance(session, ClientSession), 'session error: %s' % session
+        # the session never changes, keep it typed here
+        self.__session = session
+
+    @property  # Override
     def session(self) -> ClientSession:
-        sess = super().session
-        assert isinstance(sess, ClientSession), 'session error: %s' % sess
-        return sess
+        return self.__session
 
     # Override
     async def process_reliable_message(self, msg: ReliableMessage) -> List[ReliableMessage]:
@@ -110,14 +115,14 @@ class ClientMessenger(CommonMessenger):
             # not login yet
             content = msg.content
             if not isinstance(content, Command):
-                self.warning(msg='not handshake yet, suspend message: %s => %s' % (content, msg.receiver))
+                self.warning('not handshake yet, suspend message: %s => %s', content, msg.receiver)
                 # TODO: suspend instant message
                 return None
             elif isinstance(content, HandshakeCommand):
                 # NOTICE: only handshake message can go out
                 msg['pass'] = 'handshaking'
             else:
-                self.warning(msg='not handshake yet, drop command: %s => %s' % (content, msg.receiver))
+                self.warning('not handshake yet, drop command: %s => %s', content, msg.receiver)
                 # TODO: suspend instant message
                 return None
         return await super().send_instant_message(msg=msg, priority=priority)
@@ -132,7 +137,7 @@ class ClientMessenger(CommonMessenger):
             # not login in yet, let the handshake message go out only
             pass
         else:
-            self.warning(msg='not handshake yet, suspend message: %s => %s' % (msg.sender, msg.receiver))
+            self.warning('not handshake yet, suspend message: %s => %s', msg.sender, msg.receiver)
             # TODO: suspend reliable message
             return False
         return await super().send_reliable_message(msg=msg, priority=priority)
@@ -181,24 +186,24 @@ class ClientMessenger(CommonMessenger):
             # clone for modifying
             visa = Document.parse(document=visa.copy_dictionary(deep_copy=False))
             if not isinstance(visa, Visa):
-                self.error(msg='visa error: %s' % visa)
+                self.error('visa error: %s', visa)
                 return None
         # 3. update visa document
         visa.set_property(name='sys', value={
             'os': 'Linux',
         })
         if visa.sign(private_key=pri_key) is None:
-            self.error(msg='failed to sign visa: %s, private key: %s' % (visa, pri_key))
+            self.error('failed to sign visa: %s, private key: %s', visa, pri_key)
         elif await facebook.save_document(document=visa):
-            self.info(msg='visa updated: %s' % visa)
+            self.info('visa updated: %s', visa)
             return visa
         else:
-            self.error(msg='failed to save visa: %s' % visa)
+            self.error('failed to save visa: %s', visa)
 
     async def handshake_success(self):
         """ Callback for handshake success """
         # change the flag of current session
-        self.info(msg='handshake success, change session accepted: %s => True' % self.session.accepted)
+        self.info('handshake success, change session accepted: %s => True', self.session.accepted)
         self.session.accepted = True
         # broadcast current documents after handshake success
         await self.broadcast_documents()
@@ -212,17 +217,11 @@ class ClientMessenger(CommonMessenger):
         visa = await user.visa
         assert visa is not None, 'visa not found: %s' % user
         me = user.identifier
-        #
-        #  send to all contacts
-        #
         checker = facebook.checker
         contacts = await facebook.get_contacts(identifier=me)
-        for item in contacts:
-            await checker.send_visa(visa=visa, receiver=item, updated=updated)
-        #
-        #  broadcast to everyone@everywhere
-        #
-        await checker.send_visa(visa=visa, receiver=EVERYONE, updated=updated)
+        # send to all contacts & everyone@everywhere
+        receivers = contacts + [EVERYONE]
+        await checker.send_visa_many(visa=visa, receivers=receivers, updated=updated)
 
     async def broadcast_login(self, sender: ID, user_agent: str):
         """ send login command to keep roaming """
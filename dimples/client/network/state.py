@@ -27,7 +27,7 @@ import asyncio
 import weakref
 from abc import ABC
 from enum import IntEnum
-from typing import Optional, Union
+from typing import Optional, Union, List
 
 from dimsdk import ID
 
@@ -44,14 +44,11 @@ class StateMachine(AutoMachine, Context):
         super().__init__()
         self.__session = weakref.ref(session)
         self.__porter_ref = None
+        self.__porter_task: Optional[asyncio.Task] = None  # fetching porter
         # init states
         builder = self._create_state_builder()
-        self.add_state(state=builder.get_default_state())
-        self.add_state(state=builder.get_connecting_state())
-        self.add_state(state=builder.get_connected_state())
-        self.add_state(state=builder.get_handshaking_state())
-        self.add_state(state=builder.get_running_state())
-        self.add_state(state=builder.get_error_state())
+        for state in builder.get_states():
+            self.add_state(state=state)
 
     @property
     def session(self):  # -> ClientSession:
@@ -94,16 +91,23 @@ class StateMachine(AutoMachine, Context):
         docker = self.porter
         if docker is not None:
             return docker.status
-        else:
+        elif self.__porter_task is None:
+            # all transitions of current state ask for status in the same tick,
+            # only fetch porter once until the callback comes back
             session = self.session
             gate = session.gate
             coro = gate.fetch_porter(remote=session.remote_address, local=None)
             task = Runner.async_task(coro=coro)
             task.add_done_callback(self._fetch_porter_callback)
+            self.__porter_task = task
         # waiting for callback
         return PorterStatus.ERROR
 
     def _fetch_porter_callback(self, t: asyncio.Task):
+        self.__porter_task = None
+        if t.cancelled() or t.exception() is not None:
+            # try again next time
+            return
         self.porter = t.result()
 
 
@@ -169,9 +173,9 @@ class SessionState(BaseState[StateMachine, StateTransition]):
 
     # Override
     def __eq__(self, other) -> bool:
-        if isinstance(other, SessionState):
-            if self is other:
-                return True
+        if self is other:
+            return True
+        elif isinstance(other, SessionState):
             return self.index == other.index
         elif isinstance(other, StateOrder):
             return self.index == other.value
@@ -184,9 +188,9 @@ class SessionState(BaseState[StateMachine, StateTransition]):
 
     # Override
     def __ne__(self, other) -> bool:
-        if isinstance(other, SessionState):
-            if self is other:
-                return False
+        if self is other:
+            return False
+        elif isinstance(other, SessionState):
             return self.index != other.index
         elif isinstance(other, StateOrder):
             return self.index != other.value
@@ -224,6 +228,17 @@ class StateBuilder:
         super().__init__()
         self.__builder = transition_builder
 
+    def get_states(self) -> List[SessionState]:
+        """ all session states, in order """
+        return [
+            self.get_default_state(),
+            self.get_connecting_state(),
+            self.get_connected_state(),
+            self.get_handshaking_state(),
+            self.get_running_state(),
+            self.get_error_state(),
+        ]
+
     def get_default_state(self) -> SessionState:
         builder = self.__builder
         # assert isinstance(builder, TransitionBuilder)
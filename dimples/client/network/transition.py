@@ -29,61 +29,65 @@ from .state import StateMachine, StateTransition
 from .state import StateOrder
 
 
+# porter is connecting or connected
+CONNECTING_STATUS = frozenset([PorterStatus.PREPARING, PorterStatus.READY])
+
+
 class TransitionBuilder:
 
     # noinspection PyMethodMayBeStatic
     def get_default_connecting_transition(self):
-        return DefaultConnectingTransition(target=StateOrder.CONNECTING)
+        return _DEFAULT_CONNECTING
 
     # Connecting
 
     # noinspection PyMethodMayBeStatic
     def get_connecting_connected_transition(self):
-        return ConnectingConnectedTransition(target=StateOrder.CONNECTED)
+        return _CONNECTING_CONNECTED
 
     # noinspection PyMethodMayBeStatic
     def get_connecting_error_transition(self):
-        return ConnectingErrorTransition(target=StateOrder.ERROR)
+        return _CONNECTING_ERROR
 
     # Connected
 
     # noinspection PyMethodMayBeStatic
     def get_connected_handshaking_transition(self):
-        return ConnectedHandshakingTransition(target=StateOrder.HANDSHAKING)
+        return _CONNECTED_HANDSHAKING
 
     # noinspection PyMethodMayBeStatic
     def get_connected_error_transition(self):
-        return ConnectedErrorTransition(target=StateOrder.ERROR)
+        return _CONNECTED_ERROR
 
     # Handshaking
 
     # noinspection PyMethodMayBeStatic
     def get_handshaking_running_transition(self):
-        return HandshakingRunningTransition(target=StateOrder.RUNNING)
+        return _HANDSHAKING_RUNNING
 
     # noinspection PyMethodMayBeStatic
     def get_handshaking_connected_transition(self):
-        return HandshakingConnectedTransition(target=StateOrder.CONNECTED)
+        return _HANDSHAKING_CONNECTED
 
     # noinspection PyMethodMayBeStatic
     def get_handshaking_error_transition(self):
-        return HandshakingErrorTransition(target=StateOrder.ERROR)
+        return _HANDSHAKING_ERROR
 
     # Running
 
     # noinspection PyMethodMayBeStatic
     def get_running_default_transition(self):
-        return RunningDefaultTransition(target=StateOrder.INIT)
+        return _RUNNING_DEFAULT
 
     # noinspection PyMethodMayBeStatic
     def get_running_error_transition(self):
-        return RunningErrorTransition(target=StateOrder.ERROR)
+        return _RUNNING_ERROR
 
     # Error
 
     # noinspection PyMethodMayBeStatic
     def get_error_default_transition(self):
-        return ErrorDefaultTransition(target=StateOrder.INIT)
+        return _ERROR_DEFAULT
 
 
 #
@@ -106,7 +110,7 @@ class DefaultConnectingTransition(StateTransition):
         if ctx.session_id is None:
             # current user not set yet
             return False
-        return ctx.status in [PorterStatus.PREPARING, PorterStatus.READY]
+        return ctx.status in CONNECTING_STATUS
 
 
 class ConnectingConnectedTransition(StateTransition):
@@ -141,7 +145,7 @@ class ConnectingErrorTransition(StateTransition):
         if self.is_expired(state=ctx.current_state, now=now):
             # connecting expired, do it again
             return True
-        return ctx.status not in [PorterStatus.PREPARING, PorterStatus.READY]
+        return ctx.status not in CONNECTING_STATUS
 
 
 class ConnectedHandshakingTransition(StateTransition):
@@ -290,3 +294,21 @@ class ErrorDefaultTransition(StateTransition):
     # Override
     def evaluate(self, ctx: StateMachine, now: float) -> bool:
         return ctx.status != PorterStatus.ERROR
+
+
+#
+#   Shared Transitions
+#   (transitions keep no state, so all state machines can share them)
+#
+
+_DEFAULT_CONNECTING = DefaultConnectingTransition(target=StateOrder.CONNECTING)
+_CONNECTING_CONNECTED = ConnectingConnectedTransition(target=StateOrder.CONNECTED)
+_CONNECTING_ERROR = ConnectingErrorTransition(target=StateOrder.ERROR)
+_CONNECTED_HANDSHAKING = ConnectedHandshakingTransition(target=StateOrder.HANDSHAKING)
+_CONNECTED_ERROR = ConnectedErrorTransition(target=StateOrder.ERROR)
+_HANDSHAKING_RUNNING = HandshakingRunningTransition(target=StateOrder.RUNNING)
+_HANDSHAKING_CONNECTED = HandshakingConnectedTransition(target=StateOrder.CONNECTED)
+_HANDSHAKING_ERROR = HandshakingErrorTransition(target=StateOrder.ERROR)
+_RUNNING_DEFAULT = RunningDefaultTransition(target=StateOrder.INIT)
+_RUNNING_ERROR = RunningErrorTransition(target=StateOrder.ERROR)
+_ERROR_DEFAULT = ErrorDefaultTransition(target=StateOrder.INIT)
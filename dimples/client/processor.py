@@ -28,12 +28,13 @@
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 """
 
+import asyncio
 from typing import Optional, List
 
 from dimsdk import DateTime
 from dimsdk import EntityType
 from dimsdk import ReliableMessage
-from dimsdk import Content, TextContent
+from dimsdk import Content, TextContent, ArrayContent, FileContent
 from dimsdk import ReceiptCommand
 from dimsdk import Facebook, Messenger
 from dimsdk import ContentProcessorCreator
@@ -73,6 +74,7 @@ class ClientMessageProcessor(CommonMessageProcessor):
         now = DateTime.now()
         doc_updated = False
         mem_updated = False
+        tasks = []
         # check group document time
         last_doc_time = r_msg.get_datetime(key='GDT', default=None)
         if last_doc_time is not None:
@@ -82,8 +84,8 @@ class ClientMessageProcessor(CommonMessageProcessor):
             doc_updated = checker.set_last_document_time(identifier=group, now=last_doc_time)
             # check whether needs update
             if doc_updated:
-                self.info(msg='checking for new bulletin: %s' % group)
-                await facebook.get_documents(identifier=group)
+                self.info('checking for new bulletin: %s', group)
+                tasks.append(facebook.get_documents(identifier=group))
         # check group history time
         last_his_time = r_msg.get_datetime(key='GHT', default=None)
         if last_his_time is not None:
@@ -94,8 +96,13 @@ class ClientMessageProcessor(CommonMessageProcessor):
             # check whether needs update
             if mem_updated:
                 checker.set_last_active_member(member=r_msg.sender, group=group)
-                self.info(msg='checking for group members: %s' % group)
-                await facebook.get_members(identifier=group)
+                self.info('checking for group members: %s', group)
+                tasks.append(facebook.get_members(identifier=group))
+        # check bulletin & members concurrently
+        if len(tasks) == 1:
+            await tasks[0]
+        elif len(tasks) > 1:
+            await asyncio.gather(*tasks)
         # OK
         return doc_updated or mem_updated
 
@@ -113,6 +120,11 @@ class ClientMessageProcessor(CommonMessageProcessor):
             # urgent command
             return responses
         sender = r_msg.sender
+        from_bots = sender.type == EntityType.STATION or sender.type == EntityType.BOT
+        if from_bots and all(isinstance(res, (ReceiptCommand, TextContent)) for res in responses):
+            # no need to respond receipt/text to station or bot
+            self.info('drop %d response(s) to %s, origin msg time=[%s]', len(responses), sender, r_msg.time)
+            return []
         receiver = r_msg.receiver
         user = await self.facebook.select_user(receiver=receiver)
         if user is None:
@@ -121,22 +133,33 @@ class ClientMessageProcessor(CommonMessageProcessor):
         receiver = user.identifier
         messenger = self.messenger
         # check responses
-        from_bots = sender.type == EntityType.STATION or sender.type == EntityType.BOT
+        contents = []
         for res in responses:
             if res is None:
                 # should not happen
                 continue
+            elif isinstance(res, ArrayContent):
+                if len(res.contents) == 0:
+                    # nothing to respond for the array items
+                    continue
             elif isinstance(res, ReceiptCommand):
                 if from_bots:
                     # no need to respond receipt to station
-                    self.info(msg='drop receipt to %s, origin msg time=[%s]' % (sender, r_msg.time))
+                    self.info('drop receipt to %s, origin msg time=[%s]', sender, r_msg.time)
                     continue
             elif isinstance(res, TextContent):
                 if from_bots:
                     # no need to respond text message to station
-                    self.info(msg='drop text to %s, origin time=[%s], text=%s' % (sender, r_msg.time, res.text))
+                    self.info('drop text to %s, origin time=[%s], text=%s', sender, r_msg.time, res.text)
                     continue
+            elif isinstance(res, FileContent):
+                # file content needs to be encrypted alone
+                await messenger.send_content(sender=receiver, receiver=sender, content=res, priority=1)
+                continue
             # normal response
-            await messenger.send_content(sender=receiver, receiver=sender, content=res, priority=1)
+            contents.append(res)
+        # pack all normal responses into one message
+        if len(contents) > 0:
+            await messenger.send_contents(sender=receiver, receiver=sender, contents=contents, priority=1)
         # DON'T respond to station directly
         return []
@@ -30,10 +30,10 @@
     Client
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from dimsdk import DateTime
 from dimsdk import EntityType
 from dimsdk import Station
 from dimsdk import Packer, Processor
@@ -64,13 +64,16 @@ class DeviceMixin:
 
 class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
 
+    KEEP_ONLINE_INTERVAL = 300  # seconds
+    IDLE_INTERVAL_MAX = 60      # seconds
+
     def __init__(self, facebook: ClientFacebook, database: SessionDBI):
         super().__init__(interval=16.0)
         self.__sdb = database
         self.__facebook = facebook
         self.__messenger = None
-        # default online time
-        self.__last_time = 0
+        # last online time (monotonic), None means not login yet
+        self.__last_time: Optional[float] = None
 
     @property
     def database(self) -> SessionDBI:
@@ -192,7 +195,7 @@ class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
         #
         #  2. check timeout
         #
-        now = DateTime.current_timestamp()
+        now = time.monotonic()
         if self._needs_keep_online(last=self.__last_time, now=now):
             # update last online time
             self.__last_time = now
@@ -209,12 +212,26 @@ class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
         return False
 
     # noinspection PyMethodMayBeStatic
-    def _needs_keep_online(self, last: float, now: float) -> bool:
-        if last <= 8:
+    def _needs_keep_online(self, last: Optional[float], now: float) -> bool:
+        if last is None:
             # not login yet
             return False
         # keep online every 5 minutes
-        return last + 300 < now
+        return last + self.KEEP_ONLINE_INTERVAL < now
+
+    # Override
+    async def _idle(self):
+        # nothing to do before the next 'keep online',
+        # so sleep until it expires, but wake up in a while to check 'running'
+        last = self.__last_time
+        if last is None:
+            # not login yet, the timer will start after handshake success
+            seconds = self.IDLE_INTERVAL_MAX
+        else:
+            now = time.monotonic()
+            seconds = last + self.KEEP_ONLINE_INTERVAL - now + 1
+            seconds = min(max(seconds, self.interval), self.IDLE_INTERVAL_MAX)
+        await self.sleep(seconds=seconds)
 
     async def _keep_online(self):
         facebook = self.facebook
@@ -241,16 +258,16 @@ class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
         # called before state changed
         session = self.session
         station = session.station
-        self.info(msg='enter state: %s, %s => %s' % (state, session.identifier, station.identifier))
+        self.info('enter state: %s, %s => %s', state, session.identifier, station.identifier)
 
     # Override
     async def exit_state(self, state: SessionState, ctx: StateMachine, now: float):
         # called after state changed
         current = ctx.current_state
-        self.info(msg='server state changed: %s -> %s, %s' % (state, current, self.session.station))
+        self.info('server state changed: %s -> %s, %s', state, current, self.session.station)
         index = current.index if isinstance(current, SessionState) else -1
         if index == -1 or index == StateOrder.ERROR:
-            self.__last_time = 0
+            self.__last_time = None
             return
         elif index == StateOrder.INIT or index == StateOrder.CONNECTING:
             # check current user
@@ -258,17 +275,17 @@ class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
             if user is None:
                 self.warning(msg='current user not set')
                 return
-            self.info(msg='connect for user: %s' % user)
+            self.info('connect for user: %s', user)
             session = self.session
             remote = None if session is None else session.remote_address
             if remote is None:
-                self.warning(msg='failed to get remote address: %s' % session)
+                self.warning('failed to get remote address: %s', session)
                 return
             docker = await session.gate.fetch_porter(remote=remote, local=None)
             if docker is None:
-                self.error(msg='failed to connect: %s' % str(remote))
+                self.error('failed to connect: %s', remote)
             else:
-                self.info(msg='connected to remote: %s' % str(remote))
+                self.info('connected to remote: %s', remote)
         elif index == StateOrder.HANDSHAKING:
             # start handshake
             messenger = self.messenger
@@ -280,7 +297,7 @@ class Terminal(Runner, DeviceMixin, Logging, StateDelegate, ABC):
             if messenger is not None:
                 await messenger.handshake_success()
             # update last online time
-            self.__last_time = now
+            self.__last_time = time.monotonic()
 
     # Override
     async def pause_state(self, state: SessionState, ctx: StateMachine, now: float):
@@ -151,9 +151,12 @@ class ANSFactory(IDFactory):
 
     # Override
     def parse_identifier(self, identifier: str) -> Optional[ID]:
-        # try ANS record
-        aid = self.__ans.identifier(name=identifier)
-        if aid is None:
-            # parse by original factory
-            aid = self.__origin.parse_identifier(identifier=identifier)
-        return aid
+        # short name contains no '@', so full ID string
+        # will be parsed (and cached) by the original factory directly
+        if identifier.find('@') < 0:
+            # try ANS record
+            aid = self.__ans.identifier(name=identifier)
+            if aid is not None:
+                return aid
+        # parse by original factory
+        return self.__origin.parse_identifier(identifier=identifier)
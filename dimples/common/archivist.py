@@ -28,6 +28,7 @@
 # SOFTWARE.
 # ==============================================================================
 
+import asyncio
 import weakref
 from typing import List, Optional
 
@@ -125,9 +126,11 @@ class CommonArchivist(Archivist, Logging):
         facebook = self.facebook
         array = await self.database.get_local_users()
         if facebook is not None and array is not None:
-            for item in array:
+            # create all local users concurrently
+            tasks = [facebook.get_user(identifier=item) for item in array]
+            results = await asyncio.gather(*tasks)
+            for item, user in zip(array, results):
                 # assert await facebook.private_key_for_signature(identifier=item) is not None
-                user = await facebook.get_user(identifier=item)
                 if user is not None:
                     all_users.append(user)
                 else:
@@ -29,6 +29,7 @@
 # ==============================================================================
 
 from abc import ABC
+from collections import OrderedDict
 from typing import Optional, List, Dict
 
 from dimsdk import DateTime
@@ -47,6 +48,9 @@ class EntityChecker(ABC):
     # each respond will be expired after 10 minutes
     RESPOND_EXPIRES = 10 * 60
 
+    # max number of groups to remember the last active members
+    LAST_ACTIVE_MEMBERS_CAPACITY = 1024
+
     def __init__(self, database: AccountDBI):
         super().__init__()
         self.__database = database
@@ -60,12 +64,20 @@ class EntityChecker(ABC):
         self.__last_document_times = RecentTimeChecker()
         self.__last_history_times = RecentTimeChecker()
         # group => member
-        self.__last_active_members: Dict[ID, ID] = {}
+        self.__last_active_members: Dict[ID, ID] = OrderedDict()
 
     @property
     def database(self) -> AccountDBI:
         return self.__database
 
+    #
+    #   NOTICE: these checkers are synchronous and refresh the expired time
+    #           immediately, so as long as they are called before the first
+    #           'await' in 'query_*()', concurrent queries for the same ID
+    #           are coalesced: only the first one will be sent out, and the
+    #           others return False as duplicated.
+    #
+
     # protected
     def is_meta_query_expired(self, identifier: ID) -> bool:
         return self.__meta_queries.is_expired(key=identifier)
@@ -84,7 +96,12 @@ class EntityChecker(ABC):
 
     def set_last_active_member(self, member: ID, group: ID):
         """ Set last active member for group """
-        self.__last_active_members[group] = member
+        members = self.__last_active_members
+        members[group] = member
+        members.move_to_end(group)
+        # remove the least recently active group
+        if len(members) > self.LAST_ACTIVE_MEMBERS_CAPACITY:
+            members.popitem(last=False)
 
     # protected
     def get_last_active_member(self, group: ID) -> Optional[ID]:
@@ -217,16 +234,8 @@ class EntityChecker(ABC):
         array = await db.get_group_histories(group=group)
         if array is None or len(array) == 0:
             return None
-        last_time: Optional[DateTime] = None
-        for cmd, _ in array:
-            his_time = cmd.time
-            if his_time is None:
-                assert False, 'group command error: %s' % cmd
-                pass
-            elif last_time is None or last_time < his_time:
-                last_time = his_time
-        # OK
-        return last_time
+        # skip the command without time, it should not happen
+        return max((cmd.time for cmd, _ in array if cmd.time is not None), default=None)
 
     #
     #   Querying
@@ -280,3 +289,18 @@ class EntityChecker(ABC):
         :return: False on error
         """
         raise NotImplemented
+
+    async def send_visa_many(self, visa: Visa, receivers: List[ID], updated: bool = False) -> int:
+        """
+        Send my visa document to contacts
+
+        :param visa:
+        :param receivers:
+        :param updated:
+        :return: count of visa sent
+        """
+        count = 0
+        for item in receivers:
+            if await self.send_visa(visa=visa, receiver=item, updated=updated):
+                count += 1
+        return count
@@ -83,8 +83,21 @@ class EntityIDFactory(GeneralIdentifierFactory):
 
 class EntityID(Identifier):
 
+    def __init__(self, identifier: str, name: Optional[str], address: Address, terminal: Optional[str] = None):
+        super().__init__(identifier=identifier, name=name, address=address, terminal=terminal)
+        # ID is immutable, so the entity type & broadcast flag can be cached
+        self.__type: Optional[int] = None
+        self.__broadcast: Optional[bool] = None
+
     @property  # Override
     def type(self) -> int:
+        network = self.__type
+        if network is None:
+            self.__type = network = self._get_type()
+        return network
+
+    # protected
+    def _get_type(self) -> int:
         name = self.name
         if name is None or len(name) == 0:
             # all ID without 'name' field must be a user
@@ -93,3 +106,10 @@ class EntityID(Identifier):
         # compatible with MKM 0.9.*
         address = self.address
         return network_to_type(network=address.network)
+
+    @property  # Override
+    def is_broadcast(self) -> bool:
+        flag = self.__broadcast
+        if flag is None:
+            self.__broadcast = flag = EntityType.is_broadcast(network=self.type)
+        return flag
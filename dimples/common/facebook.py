@@ -158,7 +158,7 @@ class CommonFacebook(Facebook, Logging, ABC):
         #
         old = await self.get_meta(identifier=identifier)
         if old is not None:
-            self.debug(msg='meta duplicated: %s' % identifier)
+            self.debug('meta duplicated: %s', identifier)
             return True
         #
         #  3. save into database
@@ -185,7 +185,7 @@ class CommonFacebook(Facebook, Logging, ABC):
         #  2. check expired
         #
         if await self._check_document_expired(document=document):
-            self.info(msg='drop expired document: %s' % document)
+            self.info('drop expired document: %s', document)
             return False
         #
         #  3. save into database
@@ -198,13 +198,13 @@ class CommonFacebook(Facebook, Logging, ABC):
         doc_time = document.time
         # check document time
         if doc_time is None:
-            self.warning(msg='document without time: %s' % identifier)
+            self.warning('document without time: %s', identifier)
         else:
             # calibrate the clock
             # make sure the document time is not in the far future
             near_future = DateTime.now() + 30 * 60
             if doc_time > near_future:
-                self.error(msg='document time error: %s, %s' % (doc_time, identifier))
+                self.error('document time error: %s, %s', doc_time, identifier)
                 return False
         # check valid
         return await self._verify_document(document=document)
@@ -215,7 +215,7 @@ class CommonFacebook(Facebook, Logging, ABC):
         identifier = document.identifier
         meta = await self.get_meta(identifier=identifier)
         if meta is None:
-            self.warning(msg='failed to get meta: %s' % identifier)
+            self.warning('failed to get meta: %s', identifier)
             return False
         return document.verify(public_key=meta.public_key)
 
@@ -35,12 +35,13 @@
     Transform and send message
 """
 
+import asyncio
 from abc import ABC
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, List, Dict
 
 from dimsdk import SymmetricKey
 from dimsdk import ID
-from dimsdk import Content, Envelope
+from dimsdk import Content, ArrayContent, Envelope
 from dimsdk import FileContent, Command
 from dimsdk import InstantMessage, SecureMessage, ReliableMessage
 from dimsdk import EntityDelegate, CipherKeyDelegate
@@ -65,6 +66,8 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
         self.__database = database
         self.__packer: Optional[Packer] = None
         self.__processor: Optional[Processor] = None
+        # id(content) => serialized data, for contents sending to multiple receivers
+        self.__shared_contents: Dict[int, Optional[bytes]] = {}
 
     @property  # Override
     def packer(self) -> Packer:
@@ -108,7 +111,7 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
             return await super().encrypt_key(data=data, receiver=receiver, msg=msg)
         except Exception as error:
             # FIXME:
-            self.error(msg='failed to encrypt key: %s' % error)
+            self.error('failed to encrypt key: %s', error)
 
     # Override
     async def serialize_key(self, key: Union[dict, SymmetricKey], msg: InstantMessage) -> Optional[bytes]:
@@ -135,6 +138,18 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
 
     # Override
     async def serialize_content(self, content: Content, key: SymmetricKey, msg: InstantMessage) -> bytes:
+        shared = self.__shared_contents
+        tag = id(content)
+        if tag not in shared:
+            return await self._serialize_content(content=content, key=key, msg=msg)
+        # content shared by multiple receivers, serialize it only once
+        data = shared[tag]
+        if data is None:
+            data = await self._serialize_content(content=content, key=key, msg=msg)
+            shared[tag] = data
+        return data
+
+    async def _serialize_content(self, content: Content, key: SymmetricKey, msg: InstantMessage) -> bytes:
         if isinstance(content, Command):
             content = fix_command(content=content)
         elif isinstance(content, FileContent):
@@ -167,6 +182,54 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
         r_msg = await self.send_instant_message(msg=i_msg, priority=priority)
         return i_msg, r_msg
 
+    async def send_contents(self, contents: List[Content], sender: Optional[ID], receiver: ID,
+                            priority: int = 0) -> Tuple[InstantMessage, Optional[ReliableMessage]]:
+        """ Send message contents to the same receiver in one message """
+        if len(contents) == 1:
+            content = contents[0]
+        else:
+            # items in the array won't be fixed when serializing,
+            # so fix them for old versions before packing
+            array = []
+            for item in contents:
+                if isinstance(item, Command):
+                    item = fix_command(content=item)
+                elif isinstance(item, FileContent):
+                    item = fix_file_content(content=item)
+                array.append(item)
+            content = ArrayContent.create(contents=array)
+        return await self.send_content(content=content, sender=sender, receiver=receiver, priority=priority)
+
+    async def send_content_many(self, content: Content, sender: Optional[ID], receivers: List[ID],
+                                priority: int = 0) -> List[Optional[ReliableMessage]]:
+        """ Send same message content to multiple receivers concurrently """
+        if sender is None:
+            current = await self.facebook.current_user
+            assert current is not None, 'current user not set'
+            sender = current.identifier
+        shared = self.__shared_contents
+        tag = id(content)
+        # NOTICE: file content contains password (message key) for each receiver,
+        #         so it cannot be shared.
+        owner = tag not in shared and not isinstance(content, FileContent)
+        if owner:
+            shared[tag] = None
+        try:
+            tasks = [self.__send_content(content=content, sender=sender, receiver=item, priority=priority)
+                     for item in receivers]
+            return await asyncio.gather(*tasks)
+        finally:
+            if owner:
+                shared.pop(tag, None)
+
+    async def __send_content(self, content: Content, sender: ID, receiver: ID,
+                             priority: int) -> Optional[ReliableMessage]:
+        try:
+            _, r_msg = await self.send_content(content=content, sender=sender, receiver=receiver, priority=priority)
+            return r_msg
+        except Exception as error:
+            self.error('failed to send content: %s => %s, %s', sender, receiver, error)
+
     # private
     async def _attach_visa_time(self, sender: ID, msg: InstantMessage) -> bool:
         if isinstance(msg.content, Command):
@@ -174,12 +237,12 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
             return False
         doc = await self.facebook.get_visa(sender)
         if doc is None:
-            self.error(msg='failed to get visa document for sender: %s' % sender)
+            self.error('failed to get visa document for sender: %s', sender)
             return False
         # attach sender document time
         last_doc_time = doc.time
         if last_doc_time is None:
-            self.error(msg='document error: %s' % doc)
+            self.error('document error: %s', doc)
             return False
         else:
             msg.set_datetime(key='SDT', value=last_doc_time)
@@ -191,25 +254,25 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
         sender = msg.sender
         # 0. check cycled message
         if sender == msg.receiver:
-            self.warning(msg='cycled message: %s => %s, %s' % (sender, msg.receiver, msg.group))
+            self.warning('cycled message: %s => %s, %s', sender, msg.receiver, msg.group)
             # return None
         else:
-            self.debug(msg='send instant message message (type=%d): %s => %s, %s'
-                           % (msg.content.type, sender, msg.receiver, msg.group))
+            self.debug('send instant message message (type=%d): %s => %s, %s',
+                       msg.content.type, sender, msg.receiver, msg.group)
             # attach sender's document times
             # for the receiver to check whether user info synchronized
             ok = await self._attach_visa_time(sender=sender, msg=msg)
             if ok or isinstance(msg.content, Command):
                 pass
             else:
-                self.warning(msg='failed to attach document time: %s => %s' % (sender, msg.content))
+                self.warning('failed to attach document time: %s => %s', sender, msg.content)
         #
         #  1. encrypt message
         #
         s_msg = await self.encrypt_message(msg=msg)
         if s_msg is None:
             # public key not found?
-            self.warning(msg='failed to encrypt message: %s => %s, %s' % (sender, msg.receiver, msg.group))
+            self.warning('failed to encrypt message: %s => %s, %s', sender, msg.receiver, msg.group)
             return None
         #
         #  2. sign message
@@ -224,14 +287,14 @@ class CommonMessenger(Messenger, Transmitter, Logging, ABC):
         if await self.send_reliable_message(msg=r_msg, priority=priority):
             return r_msg
         # failed
-        self.error(msg='failed to send message: %s => %s, %s' % (sender, msg.receiver, msg.group))
+        self.error('failed to send message: %s => %s, %s', sender, msg.receiver, msg.group)
 
     # Override
     async def send_reliable_message(self, msg: ReliableMessage, priority: int = 0) -> bool:
         """ send reliable message with priority """
         # 0. check cycled message
         if msg.sender == msg.receiver:
-            self.warning(msg='cycled message: %s => %s, %s' % (msg.sender, msg.receiver, msg.group))
+            self.warning('cycled message: %s => %s, %s', msg.sender, msg.receiver, msg.group)
             # return False
         # 1. serialize message
         data = await self.serialize_message(msg=msg)
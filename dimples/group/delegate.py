@@ -212,6 +212,7 @@ class TripletsHelper(Logging):
     def __init__(self, delegate: GroupDelegate):
         super().__init__()
         self.__delegate = delegate
+        self.__database: Optional[AccountDBI] = None
 
     @property
     def delegate(self) -> GroupDelegate:
@@ -233,9 +234,14 @@ class TripletsHelper(Logging):
 
     @property
     def database(self) -> Optional[AccountDBI]:
-        facebook = self.facebook
-        if facebook is not None:
-            return facebook.database
+        db = self.__database
+        if db is None:
+            # the database of facebook will not be changed,
+            # so cache it to skip the delegate/facebook chain
+            facebook = self.facebook
+            if facebook is not None:
+                self.__database = db = facebook.database
+        return db
 
 
 # Singleton
@@ -28,7 +28,10 @@
 # SOFTWARE.
 # ==============================================================================
 
-from typing import Optional, Tuple, List
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple, List, Dict
 
 from dimsdk import DateTime
 from dimsdk import ID
@@ -36,11 +39,51 @@ from dimsdk import ReliableMessage
 from dimsdk import GroupCommand, ResetCommand, ResignCommand
 from dimsdk import DocumentUtils
 
+from ..common import AccountDBI
+
 from .delegate import TripletsHelper
 
 
 class GroupCommandHelper(TripletsHelper):
 
+    RESET_TIME_EXPIRES = 300  # seconds
+    RESET_TIME_CAPACITY = 1024
+
+    # database => {group => (reset time, expired time)}
+    # shared by all helpers on the same database, so a 'reset' saved by one of them is seen by the others
+    __reset_times: Dict[AccountDBI, Dict[ID, Tuple[Optional[DateTime], float]]] = weakref.WeakKeyDictionary()
+
+    def _get_reset_times(self) -> Dict[ID, Tuple[Optional[DateTime], float]]:
+        db = self.database
+        if db is None:
+            # database not ready, don't cache
+            return OrderedDict()
+        cache = self.__reset_times.get(db)
+        if cache is None:
+            cache = OrderedDict()
+            self.__reset_times[db] = cache
+        return cache
+
+    async def _get_reset_time(self, group: ID) -> Optional[DateTime]:
+        """ get time of the last 'reset' command (cached) """
+        pair = self._get_reset_times().get(group)
+        if pair is not None and pair[1] > time.monotonic():
+            return pair[0]
+        cmd, _ = await self.get_reset_command_message(group=group)
+        when = None if cmd is None else cmd.time
+        self._set_reset_time(group=group, when=when)
+        return when
+
+    def _set_reset_time(self, group: ID, when: Optional[DateTime]):
+        cache = self._get_reset_times()
+        cache[group] = (when, time.monotonic() + self.RESET_TIME_EXPIRES)
+        cache.move_to_end(group)
+        if len(cache) > self.RESET_TIME_CAPACITY:
+            cache.popitem(last=False)
+
+    def _clear_reset_time(self, group: ID):
+        self._get_reset_times().pop(group, None)
+
     #
     #   Group History Command
     #
@@ -64,7 +107,12 @@ class GroupCommandHelper(TripletsHelper):
         db = self.database
         if isinstance(content, ResetCommand):
             self.warning(msg='cleaning group history for "reset" command: %s => %s' % (message.sender, group))
+            self._clear_reset_time(group=group)
             await db.clear_group_member_histories(group=group)
+            if not await db.save_group_history(group=group, content=content, message=message):
+                return False
+            self._set_reset_time(group=group, when=cmd_time)
+            return True
         return await db.save_group_history(group=group, content=content, message=message)
 
     async def get_group_histories(self, group: ID) -> List[Tuple[GroupCommand, ReliableMessage]]:
@@ -76,6 +124,7 @@ class GroupCommandHelper(TripletsHelper):
         return await db.get_reset_command_message(group=group)
 
     async def clear_group_member_histories(self, group: ID) -> bool:
+        self._clear_reset_time(group=group)
         db = self.database
         return await db.clear_group_member_histories(group=group)
 
@@ -97,11 +146,11 @@ class GroupCommandHelper(TripletsHelper):
                 return True
             return DocumentUtils.is_before(old_time=doc.time, this_time=content.time)
         # membership command, check with reset command
-        cmd, _ = await self.get_reset_command_message(group=group)
-        if cmd is None:  # or msg is None:
-            self.info(msg='"reset" command not found: %s' % content)
+        reset_time = await self._get_reset_time(group=group)
+        if reset_time is None:
+            self.info('"reset" command not found: %s', content)
             return False
-        return DocumentUtils.is_before(old_time=cmd.time, this_time=content.time)
+        return DocumentUtils.is_before(old_time=reset_time, this_time=content.time)
 
     # noinspection PyMethodMayBeStatic
     def members_from_command(self, content: GroupCommand) -> List[ID]:
@@ -177,10 +177,8 @@ class GroupManager(TripletsHelper):
             return False
         # member list OK, check expelled members
         old_members = await self.delegate.get_members(identifier=group)
-        expel_list = []
-        for item in old_members:
-            if item not in members:
-                expel_list.append(item)
+        new_set = set(members)
+        expel_list = [item for item in old_members if item not in new_set]
         #
         #   1. check permission
         #
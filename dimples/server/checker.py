@@ -45,6 +45,8 @@ from ..common import StationInfo
 from ..common import EntityChecker
 from ..common import CommonFacebook, CommonMessenger
 
+from .session_center import SessionCenter
+
 
 def get_dispatcher():
     from .dispatcher import Dispatcher
@@ -57,7 +59,6 @@ def session_database():
 
 
 def session_center():
-    from .session_center import SessionCenter
     return SessionCenter()
 
 
@@ -41,6 +41,8 @@ from ...utils import Log
 from ...common import HandshakeCommand
 from ...common import CommonMessenger, Session
 
+from ..session_center import SessionCenter
+
 
 class HandshakeCommandProcessor(BaseCommandProcessor):
 
@@ -87,7 +89,6 @@ class HandshakeCommandProcessor(BaseCommandProcessor):
 
 
 async def handshake_accepted(identifier: ID, when: Optional[DateTime], session: Session, messenger: CommonMessenger):
-    from ..session_center import SessionCenter
     center = SessionCenter()
     # 1. update session ID
     center.update_session(session=session, identifier=identifier)
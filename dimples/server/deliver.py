@@ -41,6 +41,8 @@ from ..common import CommonFacebook
 from ..common import SessionDBI
 from ..common import LoginCommand
 
+from .session_center import SessionCenter
+
 
 class MessageDeliver(Logging):
     """ Delegate for delivering message """
@@ -151,7 +153,6 @@ async def bridge_message(msg: ReliableMessage, neighbor: Optional[ID], bridge: I
 
 async def session_push(msg: ReliableMessage, receiver: ID) -> int:
     """ push message via active session(s) of receiver """
-    from .session_center import SessionCenter
     center = SessionCenter()
     active_sessions = center.active_sessions(identifier=receiver)
     success = 0
@@ -35,6 +35,7 @@
     Check for querying meta, document & group members
 """
 
+import time
 from typing import Generic, TypeVar, Optional, Dict
 
 from startrek.types import Duration
@@ -47,34 +48,47 @@ K = TypeVar('K')
 class FrequencyChecker(Generic[K]):
     """ Frequency checker for duplicated queries """
 
+    # purge expired records after every 1024 checks
+    PURGE_INTERVAL = 1024
+
     def __init__(self, expires: Duration):
         super().__init__()
         self.__expires = expires
-        self.__records: Dict[K, float] = {}  # ID -> seconds
+        self.__records: Dict[K, float] = {}  # ID -> monotonic seconds
+        self.__counter = 0
 
-    def __force_expired(self, key: K, now: DateTime):
-        self.__records[key] = now + self.__expires
-        return True
-
-    def __check_expired(self, key: K, now: DateTime):
-        expired = self.__records.get(key)
-        if expired is not None and now < expired:
-            # record exists and not expired yet
-            return False
-        self.__records[key] = now + self.__expires
-        return True
+    def __purge(self, now: float):
+        records = self.__records
+        expired = [key for key, value in records.items() if value <= now]
+        for key in expired:
+            records.pop(key, None)
 
     def is_expired(self, key: K, now: DateTime = None, force: bool = False) -> bool:
+        """
+        Check whether the record of this key is expired,
+        if expired (or force == True), refresh it with new expired time
+
+        :param key:   record key
+        :param now:   current time
+        :param force: ignore last updated time, force to update now
+        :return: True on expired
+        """
         if now is None:
-            now = DateTime.now()
-        # if force == true:
-        #     ignore last updated time, force to update now
-        # else:
-        #     check last update time
-        if force:
-            return self.__force_expired(key=key, now=now)
+            now = time.monotonic()
         else:
-            return self.__check_expired(key=key, now=now)
+            # records are kept in monotonic time, convert the wall clock time
+            now = time.monotonic() - (time.time() - float(now))
+        records = self.__records
+        if not force and now < records.get(key, 0.0):
+            # record exists and not expired yet
+            return False
+        records[key] = now + self.__expires
+        # purge expired records periodically
+        self.__counter += 1
+        if self.__counter >= self.PURGE_INTERVAL:
+            self.__counter = 0
+            self.__purge(now=now)
+        return True
 
 
 class RecentTimeChecker(Generic[K]):
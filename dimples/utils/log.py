@@ -41,6 +41,13 @@ WARNING_FLAG = 0x04
 ERROR_FLAG = 0x08
 
 
+def format_msg(msg: str, args: tuple) -> str:
+    """ format message with args lazily """
+    if len(args) == 0:
+        return msg
+    return msg % args
+
+
 class Log:
 
     DEBUG = 0xFF    # 0000 1111 : debug(), info(), warning(), error()
@@ -50,40 +57,48 @@ class Log:
     LEVEL = RELEASE
 
     @classmethod
-    def debug(cls, msg: str):
+    def debug(cls, msg: str, *args):
         if cls.LEVEL & DEBUG_FLAG == 0:
             return None
-        print('[%s]  DEBUG  | %s' % (current_time(), msg))
+        print('[%s]  DEBUG  | %s' % (current_time(), format_msg(msg, args)))
 
     @classmethod
-    def info(cls, msg: str):
+    def info(cls, msg: str, *args):
         if cls.LEVEL & INFO_FLAG == 0:
             return None
-        print('[%s]         | %s' % (current_time(), msg))
+        print('[%s]         | %s' % (current_time(), format_msg(msg, args)))
 
     @classmethod
-    def warning(cls, msg: str):
+    def warning(cls, msg: str, *args):
         if cls.LEVEL & WARNING_FLAG == 0:
             return None
-        print('[%s] WARNING | %s' % (current_time(), msg))
+        print('[%s] WARNING | %s' % (current_time(), format_msg(msg, args)))
 
     @classmethod
-    def error(cls, msg: str):
+    def error(cls, msg: str, *args):
         if cls.LEVEL & ERROR_FLAG == 0:
             return None
-        print('[%s]  ERROR  | %s' % (current_time(), msg))
+        print('[%s]  ERROR  | %s' % (current_time(), format_msg(msg, args)))
 
 
 class Logging:
 
-    def debug(self, msg: str):
-        Log.debug(msg='%s >\t%s' % (self.__class__.__name__, msg))
+    def debug(self, msg: str, *args):
+        if Log.LEVEL & DEBUG_FLAG == 0:
+            return None
+        Log.debug(msg='%s >\t%s' % (self.__class__.__name__, format_msg(msg, args)))
 
-    def info(self, msg: str):
-        Log.info(msg='%s >\t%s' % (self.__class__.__name__, msg))
+    def info(self, msg: str, *args):
+        if Log.LEVEL & INFO_FLAG == 0:
+            return None
+        Log.info(msg='%s >\t%s' % (self.__class__.__name__, format_msg(msg, args)))
 
-    def warning(self, msg: str):
-        Log.warning(msg='%s >\t%s' % (self.__class__.__name__, msg))
+    def warning(self, msg: str, *args):
+        if Log.LEVEL & WARNING_FLAG == 0:
+            return None
+        Log.warning(msg='%s >\t%s' % (self.__class__.__name__, format_msg(msg, args)))
 
-    def error(self, msg: str):
-        Log.error(msg='%s >\t%s' % (self.__class__.__name__, msg))
+    def error(self, msg: str, *args):
+        if Log.LEVEL & ERROR_FLAG == 0:
+            return None
+        Log.error(msg='%s >\t%s' % (self.__class__.__name__, format_msg(msg, args)))